@@ -1,16 +1,24 @@
 """General `CalcJob` for Fireball calculations"""
 
+import functools
+import json
 import os
+import re
+from typing import Iterable, Union
 
 import numpy
 from aiida.common.datastructures import CalcInfo, CodeInfo
 from aiida.common.folders import Folder
 from aiida.engine import CalcJob
 from aiida.orm import BandsData, Dict, KpointsData, RemoteData, StructureData, TrajectoryData
+from ase.data import atomic_numbers
 
-from .utils import _lowercase_dict, _uppercase_dict, conv_to_fortran, convert_input_to_namelist_entry
+from .utils import _namelists_dict, _uppercase_dict, conv_to_fortran, conv_to_fortran_array, convert_input_to_namelist_entry
 from .validation import validate_cgopt_params, validate_dos_params, validate_fixed_coords, validate_transport_params
 
+# Quoted numeric value of the ``dt`` keyword, which Fireball expects unquoted
+_DT_QUOTE_RE = re.compile(r"(dt\s*=\s*)'([0-9.+-EeDd]+)'")
+
 
 class FireballCalculation(CalcJob):
     """General `CalcJob` for Fireball calculations"""
@@ -24,6 +32,9 @@ class FireballCalculation(CalcJob):
     _FDATA_SUBFOLDER = "./Fdata/"
     _CRASH_FILE = "CRASH"
 
+    # The bas, lvs and kpts file names are written unquoted in the input file
+    _QUOTED_FILENAMES_RE = re.compile("'(" + "|".join(map(re.escape, (_DEFAULT_BAS_FILE, _DEFAULT_LVS_FILE, _DEFAULT_KPTS_FILE))) + ")'")
+
     # Blocked keywords that are to be specified in the subclass:
     _blocked_keywords = {
         "OPTION": {
@@ -41,11 +52,22 @@ class FireballCalculation(CalcJob):
     _default_symlink_usage = False
 
     # In restarts, it will copy the following files from the parent folder
-    _restart_files_list = ["CHARGES", "*restart*"]
+    _restart_files_list = ("CHARGES", "*restart*")
 
     # In restarts, it will copy the previous folder in the following one
     _restart_copy_to = "./"
 
+    # Keywords of the cgopt.optional file, in the order they are read by Fireball, with their description
+    _CGOPT_DESCRIPTIONS = (
+        ("drmax", "Maximum atomic displacement"),
+        ("dummy", "Scale to reduce the search step if e1 < e2"),
+        ("energy_tol", "Energy tolerance for the search"),
+        ("force_tol", "Force tolerance for the search"),
+        ("max_steps", "Maximum number of CG steps"),
+        ("min_int_steps", "Minimum number of steps in the CG loop"),
+        ("switch_MD", "Number of FIRE downhill steps after BFGS minimization fails"),
+    )
+
     @classmethod
     def define(cls, spec):  # cette function déclare ce que l'utilisateur doit fournir et ce que le calcul renvoie
         """Define inputs and outputs of the calculation."""
@@ -149,22 +171,25 @@ class FireballCalculation(CalcJob):
             if "CGOPT" not in settings:
                 settings.setdefault("CGOPT", {})
 
+        # Each of the following validators only acts on its own key of the settings, so only call those that are needed
         # Validate the FIXED_COORDS setting
-        messages.extend(validate_fixed_coords(value, settings, parameters))
+        if "FIXED_COORDS" in settings:
+            messages.extend(validate_fixed_coords(value, settings, parameters))
 
         # Validate the DOS settings
-        messages.extend(validate_dos_params(value, settings, parameters))
+        if "DOS" in settings:
+            messages.extend(validate_dos_params(value, settings, parameters))
 
         # Validate the CGOPT settings
-        messages.extend(validate_cgopt_params(value, settings, parameters))
+        if "CGOPT" in settings:
+            messages.extend(validate_cgopt_params(value, settings, parameters))
 
         # Validate the TRANSPORT settings
-        messages.extend(validate_transport_params(value, settings, parameters))
+        if "TRANSPORT" in settings:
+            messages.extend(validate_transport_params(value, settings, parameters))
 
-        # Update settings with the new values
-        value["settings"] = Dict(settings)
-        # Update parameters with the new values
-        value["parameters"] = Dict(parameters)
+        # No new ``Dict`` nodes are built here: assigning them into ``value`` does not reach ``self.inputs``. The defaults
+        # filled in by the validators end up in the nested dictionaries shared with the input nodes instead.
 
         return "\n".join(messages) if messages else None
 
@@ -189,81 +214,77 @@ class FireballCalculation(CalcJob):
             )
         )
 
-        def write_in_folder(folder: Folder, filename: str, content: str):
-            """Helper function to write content to a file in the given folder."""
+        def write_in_folder(folder: Folder, filename: str, content: Union[str, Iterable[str]]):
+            """Helper function to write content, either a string or an iterable of lines, to a file in the given folder."""
             with folder.open(filename, "w") as handle:
-                handle.write(content)
-
-        # Write the input file
-        input_filecontent = self.generate_input(self.inputs.parameters.get_dict())
+                if isinstance(content, str):
+                    handle.write(content)
+                else:
+                    handle.writelines(content)
 
-        for fname in (self._DEFAULT_BAS_FILE, self._DEFAULT_LVS_FILE, self._DEFAULT_KPTS_FILE):
-            input_filecontent = input_filecontent.replace(f"'{fname}'", fname)
+        # Contents of the files to write in the folder, keyed by filename. They are all written at once below.
+        input_files: dict[str, Union[str, Iterable[str]]] = {}
 
-        import re
+        # The input file
+        input_filecontent = self.generate_input(self.inputs.parameters.get_dict())
+        input_filecontent = self._QUOTED_FILENAMES_RE.sub(r"\1", input_filecontent)
+        input_filecontent = _DT_QUOTE_RE.sub(r"\1\2", input_filecontent)
+        input_files[self.metadata.options.input_filename] = input_filecontent
 
-        input_filecontent = re.sub(r"(dt\s*=\s*)'([0-9.+-EeDd]+)'", r"\1\2", input_filecontent)
-        with folder.open(self.metadata.options.input_filename, "w") as handle:
-            handle.write(input_filecontent)
+        # Read the sites only once, they are shared by the bas and constraints files
+        numbers, positions = self._get_numbers_and_positions(self.inputs.structure)
 
-        # Write the bas file
-        write_in_folder(folder, self._DEFAULT_BAS_FILE, self.generate_bas(self.inputs.structure))
+        # The bas file
+        input_files[self._DEFAULT_BAS_FILE] = self._iter_bas_lines(numbers, positions)
 
-        # Write the lvs file
-        write_in_folder(folder, self._DEFAULT_LVS_FILE, self.generate_lvs(self.inputs.structure))
+        # The lvs file
+        input_files[self._DEFAULT_LVS_FILE] = self._iter_lvs_lines(self.inputs.structure.cell)
 
-        # Write the kpts file
-        write_in_folder(folder, self._DEFAULT_KPTS_FILE, self.generate_kpts(self.inputs.kpoints, self.inputs.structure))
+        # The kpts file
+        input_files[self._DEFAULT_KPTS_FILE] = self._iter_kpts_lines(self.inputs.kpoints, self.inputs.structure)
 
-        # Write the constraints file if the FIXED_COORDS setting is provided
+        # The constraints file if the FIXED_COORDS setting is provided
         if "FIXED_COORDS" in settings and settings["FIXED_COORDS"] is not None:
             fixed_coords = settings.pop("FIXED_COORDS")
-            fixed_coords = numpy.array(fixed_coords)
-            write_in_folder(folder, "FRAGMENTS", self.generate_constraints(self.inputs.structure, fixed_coords))
+            input_files["FRAGMENTS"] = self._iter_constraints_lines(len(numbers), fixed_coords)
 
-        # Write the dos.optional file if the DOS setting is provided
+        # The dos.optional file if the DOS setting is provided
         if "DOS" in settings and settings["DOS"] is not None:
             dos_params: dict = settings.pop("DOS")
-            parent_output_parameters = self.inputs.parent_folder.creator.outputs.output_parameters.get_dict()
-            write_in_folder(folder, "dos.optional", self.generate_dos_optional(dos_params, parent_output_parameters.get("fermi_energy", 0.0)))
+            # Only the Fermi energy is needed, so read that single attribute instead of the whole parent output dictionary
+            parent_output_parameters = self.inputs.parent_folder.creator.outputs.output_parameters
+            input_files["dos.optional"] = self.generate_dos_optional(dos_params, parent_output_parameters.base.attributes.get("fermi_energy", 0.0))
 
-        # Write the cgopt.optional file if the CGOPT setting is provided
+        # The cgopt.optional file if the CGOPT setting is provided
         if "CGOPT" in settings and settings["CGOPT"] is not None:
             cgopt_params: dict = settings.pop("CGOPT")
-            write_in_folder(folder, "cgopt.optional", self.generate_cgopt_optional(cgopt_params))
+            input_files["cgopt.optional"] = self.generate_cgopt_optional(cgopt_params)
 
         if "TRANSPORT" in settings and settings["TRANSPORT"] is not None:
             transport_params: dict = settings.pop("TRANSPORT")
             if "INTERACTION" in transport_params:
-                write_in_folder(folder, "interaction.optional", self.generate_interaction_optional(transport_params["INTERACTION"]))
+                input_files["interaction.optional"] = self.generate_interaction_optional(transport_params["INTERACTION"])
             if "ETA" in transport_params:
-                write_in_folder(folder, "eta.optional", self.generate_eta_optional(transport_params["ETA"]))
+                input_files["eta.optional"] = self.generate_eta_optional(transport_params["ETA"])
             if "TRANS" in transport_params:
-                write_in_folder(folder, "trans.optional", self.generate_trans_optional(transport_params["TRANS"]))
+                input_files["trans.optional"] = self.generate_trans_optional(transport_params["TRANS"])
             if "BIAS" in transport_params:
-                write_in_folder(folder, "bias.optional", self.generate_bias_optional(transport_params["BIAS"]))
+                input_files["bias.optional"] = self.generate_bias_optional(transport_params["BIAS"])
+
+        # Write all the files in a single pass
+        for filename, content in input_files.items():
+            write_in_folder(folder, filename, content)
 
         # operations for restart
         symlink = settings.pop("PARENT_FOLDER_SYMLINK", self._default_symlink_usage)  # a boolean
-        if symlink:
-            if "parent_folder" in self.inputs:
-                for file_name in self._restart_files_list:
-                    remote_symlink_list.append(
-                        (
-                            self.inputs.parent_folder.computer.uuid,
-                            os.path.join(self.inputs.parent_folder.get_remote_path(), file_name),
-                            self._restart_copy_to,
-                        )
-                    )
-        elif "parent_folder" in self.inputs:
-            for file_name in self._restart_files_list:
-                remote_copy_list.append(
-                    (
-                        self.inputs.parent_folder.computer.uuid,
-                        os.path.join(self.inputs.parent_folder.get_remote_path(), file_name),
-                        self._restart_copy_to,
-                    )
-                )
+        if "parent_folder" in self.inputs:
+            parent_computer_uuid = self.inputs.parent_folder.computer.uuid
+            parent_remote_path = self.inputs.parent_folder.get_remote_path()
+            restart_list = remote_symlink_list if symlink else remote_copy_list
+            restart_list.extend(
+                (parent_computer_uuid, os.path.join(parent_remote_path, file_name), self._restart_copy_to)
+                for file_name in self._restart_files_list
+            )
 
         # Prepare the code info
         codeinfo = CodeInfo()
@@ -293,125 +314,148 @@ class FireballCalculation(CalcJob):
 
         return calcinfo
 
+    @classmethod
+    @functools.cache
+    def _normalized_blocked_keywords(cls) -> dict:
+        """Return the ``_blocked_keywords`` of the class normalized to uppercase namelists and lowercase keywords.
+
+        The blocked keywords are a class constant, so the normalization is computed once per class and cached.
+        """
+        return _namelists_dict(cls._blocked_keywords, dict_name="blocked_keywords")
+
     @classmethod
     def generate_input(cls, parameters):
         """Generate the input data for the calculation."""
-        file_lines = []
+        try:
+            parameters_key = json.dumps(parameters, sort_keys=True)
+        except (TypeError, ValueError):
+            # Parameters that cannot be serialized to JSON are not cached
+            return cls._generate_input(parameters)
+        return cls._generate_input_cached(parameters_key)
 
-        input_params = _uppercase_dict(parameters, dict_name="parameters")
-        input_params = {k: _lowercase_dict(v, dict_name=k) for k, v in input_params.items()}
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _generate_input_cached(cls, parameters_key: str):
+        """Generate the input data from the JSON serialized parameters, caching the most recent results."""
+        return cls._generate_input(json.loads(parameters_key))
 
-        blocked_keywords = _uppercase_dict(cls._blocked_keywords, dict_name="blocked_keywords")
-        blocked_keywords = {k: _lowercase_dict(v, dict_name=k) for k, v in blocked_keywords.items()}
+    @classmethod
+    def _generate_input(cls, parameters):
+        """Generate the input data for the calculation, without caching."""
+        file_lines = []
 
-        # Check if there are blocked keywords in the input parameters
-        for namelist_name, namelist in blocked_keywords.items():
-            for key, value in namelist.items():
-                if key in input_params.get(namelist_name, {}):
-                    raise ValueError(f"Cannot specify the '{key}' keyword in the '{namelist_name}' namelist.")
+        input_params = _namelists_dict(parameters, dict_name="parameters")
+        blocked_keywords = cls._normalized_blocked_keywords()
 
-        # Add keywords from the blocked keywords which have values that are not None to the input parameters
         for namelist_name, namelist in blocked_keywords.items():
-            for key, value in namelist.items():
-                if value is not None:
-                    if namelist_name not in input_params:
-                        input_params[namelist_name] = {}
-                    input_params[namelist_name][key] = value
-
-        # Write the namelists
-        for namelist_name, namelist in sorted(input_params.items()):
-            file_lines.append(f"&{namelist_name}")
-            for key, value in sorted(namelist.items()):
-                file_lines.append(convert_input_to_namelist_entry(key, value)[:-1])
-            file_lines.append("&END")
-
-        return "\n".join(file_lines) + "\n"
+            # Check if there are blocked keywords in the input parameters
+            collisions = namelist.keys() & input_params.get(namelist_name, {}).keys()
+            if collisions:
+                key = next(key for key in namelist if key in collisions)
+                raise ValueError(f"Cannot specify the '{key}' keyword in the '{namelist_name}' namelist.")
+
+            # Add keywords from the blocked keywords which have values that are not None to the input parameters
+            forced_values = {key: value for key, value in namelist.items() if value is not None}
+            if forced_values:
+                input_params.setdefault(namelist_name, {}).update(forced_values)
+
+        # Write the namelists, sorting on the keys only since they are unique.
+        # The namelist entries already end with a newline, so the lines are concatenated as they are.
+        for namelist_name in sorted(input_params):
+            namelist = input_params[namelist_name]
+            file_lines.append(f"&{namelist_name}\n")
+            file_lines.extend(convert_input_to_namelist_entry(key, namelist[key]) for key in sorted(namelist))
+            file_lines.append("&END\n")
+
+        return "".join(file_lines)
+
+    @staticmethod
+    def _get_numbers_and_positions(structure: StructureData) -> tuple[list, list]:
+        """Return the atomic numbers and the cartesian positions of the sites of a structure.
+
+        They are read directly from the sites and kinds of the ``StructureData``, without building an ASE structure.
+        """
+        kind_numbers = {kind.name: atomic_numbers[kind.symbol] for kind in structure.kinds}
+        sites = structure.sites
+        return [kind_numbers[site.kind_name] for site in sites], [site.position for site in sites]
 
     @classmethod
     def generate_bas(cls, structure: StructureData):
         """Generate the bas file for the calculation (atomic positions)."""
-        ase_structure = structure.get_ase()
-        file_lines = []
-        file_lines.append(f"\t{len(ase_structure):3d}")
-
-        for atom in ase_structure:
-            file_lines.append(
-                f"{atom.number:3d} \
-{conv_to_fortran(atom.position[0])} \
-{conv_to_fortran(atom.position[1])} \
-{conv_to_fortran(atom.position[2])}"
-            )
+        return "".join(cls._iter_bas_lines(*cls._get_numbers_and_positions(structure)))
+
+    @classmethod
+    def _iter_bas_lines(cls, numbers: list, positions: list):
+        """Yield the lines of the bas file from the atomic numbers and cartesian positions of the sites."""
+        coords = conv_to_fortran_array(positions)
 
-        return "\n".join(file_lines) + "\n"
+        yield f"\t{len(numbers):3d}\n"
+        yield from map("{:3d} {} {} {}\n".format, numbers, coords[0::3], coords[1::3], coords[2::3])
 
     @classmethod
     def generate_lvs(cls, structure: StructureData):
         """Generate the lvs file for the calculation (lattice vectors)."""
-        ase_structure = structure.get_ase()
-        file_lines = []
-        for vector in ase_structure.cell.array:
-            file_lines.append(f"{conv_to_fortran(vector[0])} {conv_to_fortran(vector[1])} {conv_to_fortran(vector[2])}")
+        return "".join(cls._iter_lvs_lines(structure.cell))
 
-        return "\n".join(file_lines) + "\n"
+    @classmethod
+    def _iter_lvs_lines(cls, cell: list):
+        """Yield the lines of the lvs file from the lattice vectors."""
+        coords = conv_to_fortran_array(cell)
+        yield from map("{} {} {}\n".format, coords[0::3], coords[1::3], coords[2::3])
 
     @classmethod
     def generate_kpts(cls, kpoints: KpointsData, structure: StructureData):
         """Generate the kpts file for the calculation (write list of cartesian k-points)."""
-        file_lines = []
-        temp_kpoints = KpointsData()
-        temp_kpoints.set_cell_from_structure(structure)
+        return "".join(cls._iter_kpts_lines(kpoints, structure))
+
+    @classmethod
+    def _iter_kpts_lines(cls, kpoints: KpointsData, structure: StructureData):
+        """Yield the lines of the kpts file (list of cartesian k-points)."""
         if "kpoints" in kpoints.get_arraynames():
             scaled_kpoints = kpoints.get_kpoints()
         else:
             scaled_kpoints = kpoints.get_kpoints_mesh(print_list=True)
-        temp_kpoints.set_kpoints(scaled_kpoints, cartesian=False, weights=[1.0 / len(scaled_kpoints)] * len(scaled_kpoints))
-        cartesian_kpoints, weights = temp_kpoints.get_kpoints(cartesian=True, also_weights=True)
-        file_lines.append(f"\t{len(cartesian_kpoints):5d}")
-        for kpt, weight in zip(cartesian_kpoints, weights):
-            file_lines.append(f"{conv_to_fortran(kpt[0])} {conv_to_fortran(kpt[1])} {conv_to_fortran(kpt[2])}\t{weight:.10f}")
 
-        return "\n".join(file_lines) + "\n"
+        # Same convention as `KpointsData.reciprocal_cell`, without building a temporary `KpointsData` node
+        reciprocal_cell = 2.0 * numpy.pi * numpy.linalg.inv(numpy.array(structure.cell)).T
+        cartesian_kpoints = numpy.asarray(scaled_kpoints, dtype=float) @ reciprocal_cell
+        coords = conv_to_fortran_array(cartesian_kpoints)
+
+        # All the k-points have the same weight, so it is formatted only once into the line template
+        line_template = "{} {} {}\t" + f"{1.0 / len(cartesian_kpoints):.10f}" + "\n"
+
+        yield f"\t{len(cartesian_kpoints):5d}\n"
+        yield from map(line_template.format, coords[0::3], coords[1::3], coords[2::3])
 
     def generate_constraints(self, structure: StructureData, fixed_coords: numpy.ndarray):
         """Generate the constraints file for the calculation."""
-        ase_structure = structure.get_ase()
-        file_lines = []
-        file_lines.append("0")
-        file_lines.append("1")
-        file_lines.append(f"{len(ase_structure):3d}")
+        return "".join(self._iter_constraints_lines(len(structure.sites), fixed_coords))
 
-        for i, fix in zip(range(len(ase_structure)), fixed_coords):
-            file_lines.append(f"{i + 1:3d} {int(fix[0]):1d} {int(fix[1]):1d} {int(fix[2]):1d}")
+    def _iter_constraints_lines(self, nb_sites: int, fixed_coords: numpy.ndarray):
+        """Yield the lines of the constraints file for a structure with ``nb_sites`` sites."""
+        yield "0\n"
+        yield "1\n"
+        yield f"{nb_sites:3d}\n"
 
-        return "\n".join(file_lines) + "\n"
+        flags = numpy.asarray(fixed_coords, dtype=numpy.int8).ravel().tolist()
+        yield from map("{:3d} {:1d} {:1d} {:1d}\n".format, range(1, len(flags) // 3 + 1), flags[0::3], flags[1::3], flags[2::3])
 
     def generate_dos_optional(self, dos_params: dict, fermi_energy: float) -> str:
         """Generate the content of the file dos.optional"""
-        file_lines = []
-        file_lines.append("1.0")
-        file_lines.append(f"{dos_params['first_atom_index']:3d}\t{dos_params['last_atom_index']:3d}\t! First and last atom index")
-        file_lines.append(f"{dos_params['n_energy_steps']}\t! Number of energy steps")
-        file_lines.append(
-            f"{dos_params['Emin'] + fermi_energy:.6f}\t{(dos_params['Emax'] - dos_params['Emin']) / dos_params['n_energy_steps']}\t! Emin and dE"
+        energy_step = (dos_params["Emax"] - dos_params["Emin"]) / dos_params["n_energy_steps"]
+        return (
+            "1.0\n"
+            f"{dos_params['first_atom_index']:3d}\t{dos_params['last_atom_index']:3d}\t! First and last atom index\n"
+            f"{dos_params['n_energy_steps']}\t! Number of energy steps\n"
+            f"{dos_params['Emin'] + fermi_energy:.6f}\t{energy_step}\t! Emin and dE\n"
+            f"{dos_params['iwrttip']:1d}\t! iwrttip=1 writes the file tip_e_str.inp\n"
+            f"{dos_params['Emin_tip']:6f}\t{dos_params['Emax_tip']:6f}\t! Emin_tip and Emax_tip\n"
+            f"{dos_params['eta']:.6f}\t! eta\n"
         )
-        file_lines.append(f"{dos_params['iwrttip']:1d}\t! iwrttip=1 writes the file tip_e_str.inp")
-        file_lines.append(f"{dos_params['Emin_tip']:6f}\t{dos_params['Emax_tip']:6f}\t! Emin_tip and Emax_tip")
-        file_lines.append(f"{dos_params['eta']:.6f}\t! eta")
-
-        return "\n".join(file_lines) + "\n"
 
     def generate_cgopt_optional(self, cgopt_params: dict) -> str:
         """Generate the content of the file cgopt.optional"""
-        file_lines = []
-        file_lines.append(f"{conv_to_fortran(cgopt_params['drmax'])} \t! drmax = Maximum atomic displacement")
-        file_lines.append(f"{conv_to_fortran(cgopt_params['dummy'])} \t! dummy = Scale to reduce the search step if e1 < e2")
-        file_lines.append(f"{conv_to_fortran(cgopt_params['energy_tol'])} \t! energy_tol = Energy tolerance for the search")
-        file_lines.append(f"{conv_to_fortran(cgopt_params['force_tol'])} \t! force_tol = Force tolerance for the search")
-        file_lines.append(f"{conv_to_fortran(cgopt_params['max_steps'])} \t! max_steps = Maximum number of CG steps")
-        file_lines.append(f"{conv_to_fortran(cgopt_params['min_int_steps'])} \t! min_int_steps = Minimum number of steps in the CG loop")
-        file_lines.append(f"{conv_to_fortran(cgopt_params['switch_MD'])} \t! switch_MD = Number of FIRE downhill steps after BFGS minimization fails")
-
-        return "\n".join(file_lines) + "\n"
+        return "".join(f"{conv_to_fortran(cgopt_params[key])} \t! {key} = {description}\n" for key, description in self._CGOPT_DESCRIPTIONS)
 
     @classmethod
     def generate_interaction_optional(cls, params: dict) -> str:
@@ -420,22 +464,20 @@ class FireballCalculation(CalcJob):
         lines.append(str(params.get("ncell1", 0)))
         lines.append(str(params.get("total_atoms1", 0)))
         lines.append(str(params.get("ninterval1", 1)))
-        for s, e in params.get("intervals1", []):
-            lines.append(f"{s}  {e}")
+        lines.extend(f"{s}  {e}" for s, e in params.get("intervals1", []))
         atoms1 = params.get("atoms1", [])
         lines.append(str(params.get("natoms_tip1", len(atoms1))))
         if atoms1:
-            lines.append(",".join(str(i) for i in atoms1))
+            lines.append(",".join(map(str, atoms1)))
         # Sample 2
         lines.append(str(params.get("ncell2", 0)))
         lines.append(str(params.get("total_atoms2", 0)))
         lines.append(str(params.get("ninterval2", 1)))
-        for s, e in params.get("intervals2", []):
-            lines.append(f"{s}  {e}")
+        lines.extend(f"{s}  {e}" for s, e in params.get("intervals2", []))
         atoms2 = params.get("atoms2", [])
         lines.append(str(params.get("natoms_tip2", len(atoms2))))
         if atoms2:
-            lines.append(",".join(str(i) for i in atoms2))
+            lines.append(",".join(map(str, atoms2)))
         return "\n".join(lines) + "\n"
 
     @classmethod
@@ -444,8 +486,7 @@ class FireballCalculation(CalcJob):
         lines.append(str(params.get("imag_part", 0.0)))
         intervals = params.get("intervals", [])
         lines.append(str(len(intervals)))
-        for s, e in intervals:
-            lines.append(f"{s}   {e}")
+        lines.extend(f"{s}   {e}" for s, e in intervals)
         return "\n".join(lines) + "\n"
 
     @classmethod
@@ -461,14 +502,8 @@ class FireballCalculation(CalcJob):
             "eta": 0.0,
         }
         merged = {**defaults, **params}
-        lines = []
-        for key in ("ieta", "iwrt_trans", "ichannel"):
-            lines.append("1" if merged[key] else "0")  # <-- ici
-        lines.append(str(merged["ifithop"]))
-        lines.append(str(merged["Ebottom"]))
-        lines.append(str(merged["Etop"]))
-        lines.append(str(merged["nsteps"]))
-        lines.append(str(merged["eta"]))
+        lines = ["1" if merged[key] else "0" for key in ("ieta", "iwrt_trans", "ichannel")]
+        lines.extend(str(merged[key]) for key in ("ifithop", "Ebottom", "Etop", "nsteps", "eta"))
         return "\n".join(lines) + "\n"
 
     @classmethod
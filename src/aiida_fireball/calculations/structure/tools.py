@@ -40,7 +40,10 @@ def interpolate_structures(
         raise ValueError("`balance` must be between 0 and 1") from exc
 
     ase_interpolated = ase_origin.copy()
-    ase_interpolated.set_positions(balance.value * ase_target.positions + (1.0 - balance.value) * ase_origin.positions)
+    # balance * target + (1 - balance) * origin, accumulated in place to avoid an extra temporary array
+    positions = balance.value * ase_target.positions
+    positions += (1.0 - balance.value) * ase_origin.positions
+    ase_interpolated.set_positions(positions)
     interpolated = orm.StructureData(ase=ase_interpolated)
 
     return interpolated
@@ -70,6 +73,7 @@ def scale_structure(
     ase_scaled = ase_structure.copy()
     scales = [scale_a.value, scale_b.value, scale_c.value]
     scale_factors = [scale_factor.value if scale else 1.0 for scale in scales]
-    ase_scaled.set_cell(np.diag(scale_factors) @ ase_structure.cell, scale_atoms=True)
+    # Scale each lattice vector (row of the cell) by its factor
+    ase_scaled.set_cell(ase_structure.cell.array * np.array(scale_factors)[:, None], scale_atoms=True)
 
     return orm.StructureData(ase=ase_scaled)
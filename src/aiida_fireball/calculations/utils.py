@@ -15,6 +15,11 @@ def _uppercase_dict(dictionary, dict_name):
     return _case_transform_dict(dictionary, dict_name, "_uppercase_dict", str.upper)
 
 
+def _namelists_dict(dictionary, dict_name):
+    """Normalize a dictionary of namelists: uppercase namelist names and lowercase the keywords of each namelist."""
+    return {name: _lowercase_dict(namelist, dict_name=name) for name, namelist in _uppercase_dict(dictionary, dict_name=dict_name).items()}
+
+
 def _case_transform_dict(dictionary, dict_name, func_name, transform):
     if not isinstance(dictionary, dict):
         raise TypeError(f"{func_name} accepts only dictionaries as argument, got {type(dictionary)}")
@@ -56,6 +61,18 @@ def conv_to_fortran(val, quote_strings=True):
     return val_str
 
 
+def conv_to_fortran_array(values) -> list:
+    """Convert an array of real numbers to a flat list of fortran-friendly strings.
+
+    The format is the same as the one of `conv_to_fortran` for a single real number, but the conversion is done in one
+    pass over the flattened array, which is much faster for large arrays (atomic positions, k-points, ...).
+
+    :param values: an array-like of real numbers, of any shape.
+    :return: the list of converted strings, in the order of the flattened array.
+    """
+    return [("%18.10e" % val).replace("e", "d") for val in numpy.asarray(values, dtype=float).ravel().tolist()]
+
+
 def convert_input_to_namelist_entry(key, val, mapping=None):
     """Convert a key and a value, from an input parameters dictionary for a namelist calculation.
 
@@ -4,6 +4,50 @@ from typing import Optional
 
 import numpy
 
+# Valid keys of the ``DOS`` setting with their default value and type.
+# ``last_atom_index`` has no fixed default: it defaults to the number of sites of the structure.
+_DOS_SPEC = {
+    "first_atom_index": (1, int),
+    "last_atom_index": (None, int),
+    "Emin": (-5.0, float),
+    "Emax": (5.0, float),
+    "n_energy_steps": (100, int),
+    "eta": (0.1, float),
+    "iwrttip": (0, int),  # writes the file tip_e_str.inp
+    "Emin_tip": (0.0, float),
+    "Emax_tip": (0.0, float),
+}
+
+# Valid keys of the ``CGOPT`` setting with their default value and type
+_CGOPT_SPEC = {
+    "drmax": (0.1, float),
+    "dummy": (0.1, float),
+    "energy_tol": (1.0e-06, float),
+    "force_tol": (1.0e-4, float),
+    "max_steps": (1000, int),
+    "min_int_steps": (0, int),
+    "switch_MD": (0, int),
+}
+
+# Mandatory keys of the ``INTERACTION`` and ``TRANS`` blocks of the ``TRANSPORT`` setting
+_TRANSPORT_INTERACTION_KEYS = frozenset(
+    {
+        "ncell1",
+        "total_atoms1",
+        "ninterval1",
+        "intervals1",
+        "natoms_tip1",
+        "atoms1",
+        "ncell2",
+        "total_atoms2",
+        "ninterval2",
+        "intervals2",
+        "natoms_tip2",
+        "atoms2",
+    }
+)
+_TRANSPORT_TRANS_KEYS = frozenset({"ieta", "iwrt_trans", "ichannel", "ifithop", "Ebottom", "Etop", "nsteps", "eta"})
+
 
 def validate_fixed_coords(value, settings: dict, parameters: dict) -> list[str]:
     """Validate the ``fixed_coords`` input port.
@@ -19,12 +63,12 @@ def validate_fixed_coords(value, settings: dict, parameters: dict) -> list[str]:
     fixed_coords = settings.get("FIXED_COORDS", None)
 
     if fixed_coords is not None:
-        fixed_coords = numpy.array(fixed_coords)
+        fixed_coords = numpy.asarray(fixed_coords)
 
-        if len(fixed_coords.shape) != 2 or fixed_coords.shape[1] != 3:
+        if fixed_coords.ndim != 2 or fixed_coords.shape[1] != 3:
             messages.append("The `fixed_coords` setting must be a list of lists with length 3.")
 
-        if fixed_coords.dtype != bool:
+        if fixed_coords.dtype.kind != "b":
             messages.append("All elements in the `fixed_coords` setting lists must be either `True` or `False`.")
 
         if "structure" in value:
@@ -49,67 +93,35 @@ def validate_dos_params(value, settings: dict, parameters: dict) -> list[str]:
 
     if dos_params is not None:
         parameters.setdefault("OUTPUT", {}).setdefault("iwrtdos", 1)
-        valid_keys = [
-            "first_atom_index",
-            "last_atom_index",
-            "Emin",
-            "Emax",
-            "n_energy_steps",
-            "eta",
-            "iwrttip",
-            "Emin_tip",
-            "Emax_tip",
-        ]
-        defaults = {
-            "first_atom_index": 1,
-            "last_atom_index": len(value["structure"].sites),
-            "eta": 0.1,
-            "n_energy_steps": 100,
-            "Emin": -5.0,
-            "Emax": 5.0,
-            "iwrttip": 0,  # writes the file tip_e_str.inp
-            "Emin_tip": 0.0,
-            "Emax_tip": 0.0,
-        }
-        types = {
-            "first_atom_index": int,
-            "last_atom_index": int,
-            "eta": float,
-            "n_energy_steps": int,
-            "Emin": float,
-            "Emax": float,
-            "iwrttip": int,
-            "Emin_tip": float,
-            "Emax_tip": float,
-        }
+        if "parent_folder" not in value:
+            messages.append("The 'DOS' setting requires a `parent_folder` to read the Fermi energy from.")
+        if "structure" not in value:
+            # A missing structure is already reported by the port validation, the atom indices cannot be checked without it
+            return messages
+        # Every access to `StructureData.sites` rebuilds the list of `Site` objects, so only count them once
+        nb_sites = len(value["structure"].sites)
         # Emin and Emax are in eV and are relative to the Fermi level:
         # conversion to Fireball format will be performed
         # There will be (n_energy_steps + 1) energy points in the output DOS file
         for key in dos_params:
-            if key not in valid_keys:
-                messages.append(f"Invalid key '{key}' in the 'DOS' namelist. Valid keys are: {valid_keys}")
-
-        for key, default in defaults.items():
-            dos_params.setdefault(key, default)
+            if key not in _DOS_SPEC:
+                messages.append(f"Invalid key '{key}' in the 'DOS' namelist. Valid keys are: {list(_DOS_SPEC)}")
 
-        for key in valid_keys:
-            val = dos_params[key]
-            type_ = types[key]
+        for key, (default, type_) in _DOS_SPEC.items():
+            val = dos_params.setdefault(key, nb_sites if default is None else default)
             try:
                 dos_params[key] = type_(val)
             except ValueError:
                 messages.append(f"Invalid value for '{key}' in the 'DOS' namelist. It must be a {type_}")
 
-        if dos_params["first_atom_index"] < 1 or dos_params["first_atom_index"] > len(value["structure"].sites):
-            messages.append(f"Invalid value for 'first_atom_index' in the 'DOS' namelist. It must be between 1 and {len(value['structure'].sites)}")
-        if (
-            dos_params["last_atom_index"] < 1
-            or dos_params["last_atom_index"] > len(value["structure"].sites)
-            or dos_params["last_atom_index"] < dos_params["first_atom_index"]
-        ):
+        first_atom_index = dos_params["first_atom_index"]
+        last_atom_index = dos_params["last_atom_index"]
+        if not 1 <= first_atom_index <= nb_sites:
+            messages.append(f"Invalid value for 'first_atom_index' in the 'DOS' namelist. It must be between 1 and {nb_sites}")
+        if not 1 <= last_atom_index <= nb_sites or last_atom_index < first_atom_index:
             messages.append(
                 f"Invalid value for 'last_atom_index' in the 'DOS' namelist. \
-It must be between 1 and {len(value['structure'].sites)} and greater than 'first_atom_index'"
+It must be between 1 and {nb_sites} and greater than 'first_atom_index'"
             )
         if dos_params["n_energy_steps"] < 1:
             messages.append("Invalid value for 'n_energy_steps' in the 'DOS' namelist. It must be greater than 0")
@@ -140,43 +152,12 @@ def validate_cgopt_params(value, settings: dict, parameters: dict) -> list[str]:
     cgopt_params: Optional[dict] = settings.get("CGOPT", None)
 
     if cgopt_params is not None:
-        valid_keys = [
-            "drmax",
-            "dummy",
-            "energy_tol",
-            "force_tol",
-            "max_steps",
-            "min_int_steps",
-            "switch_MD",
-        ]
-        defaults = {
-            "drmax": 0.1,
-            "dummy": 0.1,
-            "energy_tol": 1.0e-06,
-            "force_tol": 1.0e-4,
-            "max_steps": 1000,
-            "min_int_steps": 0,
-            "switch_MD": 0,
-        }
-        types = {
-            "drmax": float,
-            "dummy": float,
-            "energy_tol": float,
-            "force_tol": float,
-            "max_steps": int,
-            "min_int_steps": int,
-            "switch_MD": int,
-        }
         for key in cgopt_params:
-            if key not in valid_keys:
-                messages.append(f"Invalid key '{key}' in the 'CGOPT' namelist. Valid keys are: {valid_keys}")
-
-        for key, val in defaults.items():
-            cgopt_params.setdefault(key, val)
+            if key not in _CGOPT_SPEC:
+                messages.append(f"Invalid key '{key}' in the 'CGOPT' namelist. Valid keys are: {list(_CGOPT_SPEC)}")
 
-        for key in valid_keys:
-            type_ = types[key]
-            val = cgopt_params[key]
+        for key, (default, type_) in _CGOPT_SPEC.items():
+            val = cgopt_params.setdefault(key, default)
             try:
                 cgopt_params[key] = type_(val)
             except ValueError:
@@ -226,21 +207,7 @@ def validate_transport_params(value, settings: dict, parameters: dict) -> list[s
 
         if "INTERACTION" in transport_params:
             interaction = transport_params["INTERACTION"]
-            needed = {
-                "ncell1",
-                "total_atoms1",
-                "ninterval1",
-                "intervals1",
-                "natoms_tip1",
-                "atoms1",
-                "ncell2",
-                "total_atoms2",
-                "ninterval2",
-                "intervals2",
-                "natoms_tip2",
-                "atoms2",
-            }
-            if not all(k in interaction for k in needed):
+            if not _TRANSPORT_INTERACTION_KEYS.issubset(interaction):
                 messages.append("TRANSPORT.interaction missing mandatory keys")
             if not isinstance(interaction["intervals1"], list) or not all(len(t) == 2 for t in interaction["intervals1"]):
                 messages.append("Invalid 'intervals1' format in TRANSPORT.interaction")
@@ -260,8 +227,7 @@ def validate_transport_params(value, settings: dict, parameters: dict) -> list[s
 
         if "TRANS" in transport_params:
             trans = transport_params["TRANS"]
-            needed = {"ieta", "iwrt_trans", "ichannel", "ifithop", "Ebottom", "Etop", "nsteps", "eta"}
-            if not all(k in trans for k in needed):
+            if not _TRANSPORT_TRANS_KEYS.issubset(trans):
                 messages.append("TRANSPORT.trans missing mandatory keys")
             if not isinstance(trans["ieta"], bool) or not isinstance(trans["iwrt_trans"], bool) or not isinstance(trans["ichannel"], bool):
                 messages.append("TRANSPORT.trans boolean flags must be bool")
@@ -18,7 +18,8 @@ from .raw import parse_raw_stdout
 class FireballParser(Parser):
     """`Parser` implementation for the `FireballCalculation` calculation job class."""
 
-    success_string = "(FIREBALL RUNTIME)|(That`sall for now)"
+    # Any of these literal strings in the stdout means that Fireball terminated normally
+    success_strings = ("FIREBALL RUNTIME", "That`sall for now")
 
     def parse(self, **kwargs):
         """Parse outputs and store results in the database."""
@@ -100,7 +101,7 @@ class FireballParser(Parser):
         :returns: tuple of two dictionaries, with the parsed data and log messages, respectively.
         """
 
-        if not re.search(cls.success_string, stdout):
+        if not any(success_string in stdout for success_string in cls.success_strings):
             logs.error.append("ERROR_OUTPUT_STDOUT_INCOMPLETE")
 
         parsed_data = parse_raw_stdout(stdout)
@@ -293,20 +294,22 @@ class FireballParser(Parser):
         :param logs: log dictionaries
         :param ignore: list of log messages to ignore
         """
-        ignore = ignore or []
+        ignore = set(ignore or ())
 
         if not isinstance(logs, (list, tuple)):
             logs = [logs]
 
-        for logs in logs:
-            for level, messages in logs.items():
+        for log in logs:
+            for level, messages in log.items():
+                log_method = getattr(self.logger, level)
                 for message in messages:
-                    stripped = message.strip()
+                    # Exceptions are also appended to the logs, so convert them to their message first
+                    stripped = str(message).strip()
 
                     if stripped in ignore:
                         continue
 
-                    getattr(self.logger, level)(stripped)
+                    log_method(stripped)
 
     def exit(self, exit_code: Optional[ExitCode] = None, logs: Optional[AttributeDict] = None) -> ExitCode:
         """Log all messages in the ``logs`` as well as the ``exit_code`` message and return the correct exit code.
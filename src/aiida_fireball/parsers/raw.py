@@ -2,6 +2,34 @@
 
 import re
 
+# Fields of the stdout that are parsed from the first match of a pattern as a float: (key, pattern, units)
+_FLOAT_FIELDS = (
+    ("wall_time_seconds", re.compile(r"FIREBALL RUNTIME :\s*(\d+\.\d+)\s*\[sec\]"), None),
+    ("fermi_energy", re.compile(r"Fermi Level\s*=\s*([+-]?\d+\.\d+)"), "eV"),
+    ("number_of_electrons", re.compile(r"qztot\s*=\s*(\d+\.\d+)"), None),
+    ("energy_tolerance", re.compile(r"energy tolerance\s*=\s*(\d+\.\d+(E[+-]\d+)?)\s*\[eV\]"), "eV"),
+    ("force_tolerance", re.compile(r"force tolerance\s*=\s*(\d+\.\d+(E[+-]\d+)?)\s*\[eV/A\]"), "eV/A"),
+    ("sigma_tolerance", re.compile(r"sigmatol\s*=\s*(\d+\.\d+(E[+-]\d+)?)"), None),
+    ("beta_mixing", re.compile(r"bmix\s*=\s*(\d+\.\d+(E[+-]\d+)?)"), None),
+    ("charge_state", re.compile(r"qstate\s*=\s*(\d+\.\d+(E[+-]\d+)?)"), None),
+    ("rescale_factor", re.compile(r"rescalar\s*=\s*(\d+\.\d+)"), None),
+)
+
+_ETOT_RE = re.compile(r"ETOT\s*=\s*([+-]?\d+\.\d+)")
+_IQOUT_RE = re.compile(r"iqout\s*=\s*(\d)")
+_IQUENCH_RE = re.compile(r"iquench\s*=\s*([+-]?\d+)\s*\n")
+
+_CHARGE_TYPES = {1: "Lowdin", 2: "Mulliken", 3: "Natural"}
+
+_QUENCHING_MODES = {
+    0: "Free dynamics (Newton)",
+    -1: "Dynamical quenching",
+    -2: "Crude constant temperature MD",
+    -3: "Power quenching",
+    -4: "Conjugate gradient minimization",
+    -5: "Newton-CG minimization (l-bfgs-b)",
+}
+
 
 def parse_raw_stdout(stdout):
     """Parse the raw stdout output of a Fireball calculation.
@@ -11,88 +39,33 @@ def parse_raw_stdout(stdout):
     """
     parsed_data = {}
 
-    # Parse the walltime
-    match = re.search(r"FIREBALL RUNTIME :\s*(\d+\.\d+)\s*\[sec\]", stdout)
-    if match:
-        parsed_data["wall_time_seconds"] = float(match.group(1))
+    # Parse the walltime, the Fermi energy, the number of electrons, the tolerances, the mixing and the charge state
+    for key, pattern, units in _FLOAT_FIELDS:
+        match = pattern.search(stdout)
+        if match:
+            parsed_data[key] = float(match.group(1))
+            if units is not None:
+                parsed_data[f"{key}_units"] = units
 
-    # Parse the total energy
-    matches = re.findall(r"ETOT\s*=\s*([+-]?\d+\.\d+)", stdout)
+    # Parse the total energy and the energy trajectory
+    matches = _ETOT_RE.findall(stdout)
     if matches:
         parsed_data["energy"] = float(matches[-1])
         parsed_data["energy_units"] = "eV"
-
-    # Parse the energy trajectory
-    if matches:
         parsed_data["energy_trajectory"] = list(map(float, matches))
 
-    # Parse the Fermi energy
-    match = re.search(r"Fermi Level\s*=\s*([+-]?\d+\.\d+)", stdout)
-    if match:
-        parsed_data["fermi_energy"] = float(match.group(1))
-        parsed_data["fermi_energy_units"] = "eV"
-
-    # Parse the number of electrons
-    match = re.search(r"qztot\s*=\s*(\d+\.\d+)", stdout)
-    if match:
-        parsed_data["number_of_electrons"] = float(match.group(1))
-
-    # Parse energy tolerance
-    match = re.search(r"energy tolerance\s*=\s*(\d+\.\d+(E[+-]\d+)?)\s*\[eV\]", stdout)
-    if match:
-        parsed_data["energy_tolerance"] = float(match.group(1))
-        parsed_data["energy_tolerance_units"] = "eV"
-
-    # Parse force tolerance
-    match = re.search(r"force tolerance\s*=\s*(\d+\.\d+(E[+-]\d+)?)\s*\[eV/A\]", stdout)
-    if match:
-        parsed_data["force_tolerance"] = float(match.group(1))
-        parsed_data["force_tolerance_units"] = "eV/A"
-
-    # Parse sigma tolerance
-    match = re.search(r"sigmatol\s*=\s*(\d+\.\d+(E[+-]\d+)?)", stdout)
-    if match:
-        parsed_data["sigma_tolerance"] = float(match.group(1))
-
-    # Parse beta mixing
-    match = re.search(r"bmix\s*=\s*(\d+\.\d+(E[+-]\d+)?)", stdout)
-    if match:
-        parsed_data["beta_mixing"] = float(match.group(1))
-
-    # Parse the charge state
-    match = re.search(r"qstate\s*=\s*(\d+\.\d+(E[+-]\d+)?)", stdout)
-    if match:
-        parsed_data["charge_state"] = float(match.group(1))
-
     # Parse charge type
-    match = re.search(r"iqout\s*=\s*(\d)", stdout)
-    if match:
-        charge_types = {1: "Lowdin", 2: "Mulliken", 3: "Natural"}
-        parsed_data["charge_type"] = charge_types[int(match.group(1))]
-
-    # Parse the rescal value
-    match = re.search(r"rescalar\s*=\s*(\d+\.\d+)", stdout)
+    match = _IQOUT_RE.search(stdout)
     if match:
-        parsed_data["rescale_factor"] = float(match.group(1))
+        parsed_data["charge_type"] = _CHARGE_TYPES[int(match.group(1))]
 
     # Parse the quenching mode
-    match = re.search(r"iquench\s*=\s*([+-]?\d+)\s*\n", stdout)
+    match = _IQUENCH_RE.search(stdout)
     if match:
-        quenching_modes = {
-            0: "Free dynamics (Newton)",
-            -1: "Dynamical quenching",
-            -2: "Crude constant temperature MD",
-            -3: "Power quenching",
-            -4: "Conjugate gradient minimization",
-            -5: "Newton-CG minimization (l-bfgs-b)",
-        }
-
-        def mode(n):
-            if n <= 0:
-                return quenching_modes[n]
-            else:
-                return f"Periodic quenching every {n} steps"
-
-        parsed_data["quenching_mode"] = mode(int(match.group(1)))
+        quenching = int(match.group(1))
+        if quenching <= 0:
+            parsed_data["quenching_mode"] = _QUENCHING_MODES[quenching]
+        else:
+            parsed_data["quenching_mode"] = f"Periodic quenching every {quenching} steps"
 
     return parsed_data
@@ -177,6 +177,23 @@ def test_fireball_blocked_keywords(fixture_sandbox, generate_calc_job, generate_
         generate_calc_job(fixture_sandbox, entry_point_name, inputs)
 
 
+def test_generate_input_cache():
+    """Test that `generate_input` gives the same result whether or not the parameters are cached."""
+    parameters = {"OPTION": {"nstepf": 100, "dt": 0.25}, "OUTPUT": {"iwrtxyz": 1}}
+
+    expected = FireballCalculation._generate_input(parameters)
+    assert FireballCalculation.generate_input(parameters) == expected
+    assert FireballCalculation.generate_input(dict(reversed(parameters.items()))) == expected
+    # Parameters that cannot be serialized to JSON bypass the cache
+    assert FireballCalculation.generate_input({"OPTION": {"nstepf": np.int64(100), "dt": 0.25}, "OUTPUT": {"iwrtxyz": 1}}) == expected
+
+    # Blocked keywords are still rejected once the parameters have been cached
+    parameters["OPTION"]["basisfile"] = "test.bas"
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Cannot specify the 'basisfile' keyword in the 'OPTION' namelist."):
+            FireballCalculation.generate_input(parameters)
+
+
 def test_fireball_dos_settings_invalid_key(fixture_sandbox, generate_calc_job, generate_inputs_fireball):
     """Test a `FireballCalculation` with DOS settings."""
     entry_point_name = "fireball.fireball"
@@ -192,6 +209,20 @@ Invalid key 'invalid_key' in the 'DOS' namelist. Valid keys are: \
         generate_calc_job(fixture_sandbox, entry_point_name, inputs)
 
 
+def test_fireball_dos_settings_no_parent_folder(fixture_sandbox, generate_calc_job, generate_inputs_fireball):
+    """Test a `FireballCalculation` with DOS settings but without a parent folder."""
+    entry_point_name = "fireball.fireball"
+
+    inputs = generate_inputs_fireball()
+    del inputs["parent_folder"]
+    inputs["settings"] = orm.Dict(dict={"DOS": {}})
+
+    error_message = "The 'DOS' setting requires a `parent_folder` to read the Fermi energy from."
+
+    with pytest.raises(ValueError, match=re.escape(error_message)):
+        generate_calc_job(fixture_sandbox, entry_point_name, inputs)
+
+
 @pytest.mark.parametrize(
     ["dos_params", "error_message"],
     [
@@ -272,6 +303,21 @@ def test_fireball_dos_settings(
     file_regression.check(input_written, encoding="utf-8", extension=".in")
 
 
+def test_fireball_dos_settings_lowercase(fixture_sandbox, generate_calc_job, generate_inputs_fireball, generate_calc_job_node, fixture_localhost):
+    """Test that the DOS settings are picked up when given with a lowercase key."""
+    entry_point_name = "fireball.fireball"
+
+    node = generate_calc_job_node(entry_point_name, fixture_localhost, test_name="test_fireball_dos_settings")
+
+    inputs = generate_inputs_fireball()
+    inputs["parent_folder"] = node.outputs.remote_folder
+    inputs["settings"] = orm.Dict(dict={"dos": {}})
+
+    generate_calc_job(fixture_sandbox, entry_point_name, inputs)
+
+    assert "dos.optional" in fixture_sandbox.get_content_list()
+
+
 def test_fireball_transport_generation(
     fixture_sandbox,
     generate_calc_job,
@@ -5,8 +5,10 @@ from aiida.common import exceptions
 from aiida_fireball.calculations.utils import (
     _case_transform_dict,
     _lowercase_dict,
+    _namelists_dict,
     _uppercase_dict,
     conv_to_fortran,
+    conv_to_fortran_array,
     convert_input_to_namelist_entry,
 )
 
@@ -23,6 +25,12 @@ def test_uppercase_dict():
     assert _uppercase_dict(input_dict, "test_dict") == expected_output
 
 
+def test_namelists_dict():
+    input_dict = {"option": {"IQuench": -1}, "Output": {"iwrtxyz": 1}}
+    expected_output = {"OPTION": {"iquench": -1}, "OUTPUT": {"iwrtxyz": 1}}
+    assert _namelists_dict(input_dict, "test_dict") == expected_output
+
+
 def test_case_transform_dict_type_error():
     with pytest.raises(TypeError):
         _case_transform_dict("not_a_dict", "test_dict", "_case_transform_dict", str.lower)
@@ -47,6 +55,11 @@ def test_conv_to_fortran_float():
     assert conv_to_fortran(3.14159) == "  3.1415900000d+00"
 
 
+def test_conv_to_fortran_array():
+    values = [[3.14159, -0.0, 1.0e-12], [-2.5e10, 0.5, 7.0]]
+    assert conv_to_fortran_array(values) == [conv_to_fortran(val) for row in values for val in row]
+
+
 def test_conv_to_fortran_str():
     assert conv_to_fortran("test") == "'test'"
     assert conv_to_fortran("test", quote_strings=False) == "test"